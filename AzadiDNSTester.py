@@ -8,24 +8,70 @@ requires: pip install dnspython tqdm
 import re
 import os
 import sys
+import math
+import mmap
 import time
+import heapq
+import queue
+import argparse
+import random
 import socket
+import struct
+import asyncio
 import threading
+import multiprocessing
+import dns.name
 import dns.resolver
 import dns.exception
 from tqdm import tqdm
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-file_lock = threading.Lock()
+# directory where script is located, results go next to it
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKING_PATH = os.path.join(SCRIPT_DIR, 'working_dns.txt')
 
-def get_script_dir():
-    """get directory where script is located"""
-    return os.path.dirname(os.path.abspath(__file__))
+# test_single_server result codes
+OK, FIREWALL, NXDOMAIN, TIMEOUT, NO_ANSWER, DNS_ERROR, ERROR, CRASH = range(8)
+STATUS_TEXT = {
+    NXDOMAIN: "nxdomain",
+    TIMEOUT: "timeout",
+    NO_ANSWER: "no answer",
+    DNS_ERROR: "dns error",
+    ERROR: "error",
+}
+
+# dns failures with their own result code (subclasses included),
+# any other DNSException is DNS_ERROR
+ERROR_CODES = {
+    dns.resolver.NXDOMAIN: NXDOMAIN,
+    dns.exception.Timeout: TIMEOUT,
+    dns.resolver.NoAnswer: NO_ANSWER,
+}
+
+# (server, domain) -> (monotonic time, error type, error args, (ips, response_time)),
+# see query_server
+response_cache = {}
+
+# server lists at least this big are scanned by a process pool
+PARALLEL_SCAN_BYTES = 8 << 20
+
+# progress bar refresh interval, in completed tests
+PROGRESS_EVERY = 25
+
+# packed 4-byte form, compared directly against raw A record data
+FIREWALL_IPS = frozenset(
+    socket.inet_aton(ip) for ip in ('10.10.34.34', '10.10.34.35', '10.10.34.36')
+)
+
+# octets 0-255 without leading zeros, which inet_aton rejects or reads as octal
+IP_PATTERN = re.compile(
+    r'\b(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}'
+    r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\b'
+)
 
 def create_sample_servers(filename='dns_servers.txt'):
     """create sample dns servers file if it doesn't exist"""
-    filepath = os.path.join(get_script_dir(), filename)
+    filepath = os.path.join(SCRIPT_DIR, filename)
     if os.path.exists(filepath):
         return
     
@@ -42,23 +88,48 @@ def create_sample_servers(filename='dns_servers.txt'):
     except Exception as e:
         print(f"error creating {filename}: {e}")
 
+def scan_chunk(chunk):
+    """unique ips and total match count in one chunk of a server list"""
+    seen = set()
+    add = seen.add
+    total_found = 0
+    for match in IP_PATTERN.finditer(chunk.decode('utf-8', errors='ignore')):
+        add(match.group(0))
+        total_found += 1
+    return seen, total_found
+
+def split_chunks(data, count):
+    """split data into about `count` chunks, each ending on a newline"""
+    size = len(data) // count + 1
+    chunks = []
+    start = 0
+    while start < len(data):
+        end = data.find(b'\n', start + size)
+        end = len(data) if end == -1 else end + 1
+        chunks.append(data[start:end])
+        start = end
+    return chunks
+
 def load_servers(filename='dns_servers.txt'):
-    """load all ipv4 addresses from file"""
-    filepath = os.path.join(get_script_dir(), filename)
+    """load all ipv4 addresses from file (IP_PATTERN skips leading-zero octets)"""
+    filepath = os.path.join(SCRIPT_DIR, filename)
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        ip_pattern = re.compile(
-            r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b'
-        )
+        with open(filepath, 'rb') as f:
+            workers = os.cpu_count() or 1
+            if workers > 1 and os.fstat(f.fileno()).st_size >= PARALLEL_SCAN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    chunks = split_chunks(data, workers)
+                with multiprocessing.Pool(workers) as pool:
+                    results = pool.map(scan_chunk, chunks)
+            else:
+                results = [scan_chunk(f.read())]
         
-        all_ips = ip_pattern.findall(content)
-        servers = list(set(all_ips))
+        seen = set().union(*(found for found, _ in results))
+        total_found = sum(count for _, count in results)
+        servers = list(seen)
         
         print(f"extracted {len(servers)} unique ipv4 addresses from {filepath}")
-        print(f"total ips found (with duplicates): {len(all_ips)}")
+        print(f"total ips found (with duplicates): {total_found}")
         
         if not servers:
             print("no valid ipv4 addresses found. creating sample file...")
@@ -75,33 +146,49 @@ def load_servers(filename='dns_servers.txt'):
         print(f"error loading servers: {e}")
         return []
 
-def write_header(test_domain, include_firewall=False):
+def open_working_file():
+    """truncate working_dns.txt and return an append-only fd for this run"""
+    return os.open(WORKING_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+
+def write_header(fd, test_domain, include_firewall=False):
     """write header to working_dns.txt once before testing"""
-    filepath = os.path.join(get_script_dir(), 'working_dns.txt')
     timestamp = datetime.now().strftime("%y-%m-%d %H:%M:%S")
     filter_mode = "including all responses" if include_firewall else "filtering firewall responses"
+    header = (
+        f"# working dns servers - tested: {timestamp}\n"
+        f"# test domain: {test_domain}\n"
+        f"# mode: {filter_mode} - 10.10.34.34, 10.10.34.35, 10.10.34.36\n"
+        "# format: ip (response_time_ms) [firewall: fw_ip]\n"
+    ).encode()
     
-    with file_lock:
-        try:
-            with open(filepath, 'w') as f:
-                f.write(f"# working dns servers - tested: {timestamp}\n")
-                f.write(f"# test domain: {test_domain}\n")
-                f.write(f"# mode: {filter_mode} - 10.10.34.34, 10.10.34.35, 10.10.34.36\n")
-                f.write("# format: ip (response_time_ms) [firewall: fw_ip]\n")
-            print("header written to working_dns.txt")
-        except Exception as e:
-            print(f"header write error: {e}")
-
-def real_time_save(server_info):
-    """thread-safe real-time save of working servers (append only)"""
-    filepath = os.path.join(get_script_dir(), 'working_dns.txt')
-    
-    with file_lock:
-        try:
-            with open(filepath, 'a') as f:
-                f.write(f"{server_info}\n")
-        except Exception as e:
-            print(f"real-time save error: {e}")
+    try:
+        os.write(fd, header)
+        print("header written to working_dns.txt")
+    except Exception as e:
+        print(f"header write error: {e}")
+
+def real_time_save(save_queue, server_info):
+    """queue a working server for the background writer"""
+    save_queue.put(server_info)
+
+def save_writer(fd, save_queue):
+    """append queued servers to working_dns.txt, one os.write per drained batch"""
+    try:
+        while True:
+            items = [save_queue.get()]
+            while True:
+                try:
+                    items.append(save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [item for item in items if item is not None]
+            if lines:
+                os.write(fd, ('\n'.join(lines) + '\n').encode())
+            if None in items:
+                return
+    except Exception as e:
+        print(f"real-time save error: {e}")
 
 def get_worker_count():
     """get worker count from user with validation"""
@@ -155,6 +242,13 @@ def get_filter_option():
             return True
         print("enter 1 or 2")
 
+def get_reliability_option():
+    """ask user if working servers should get a replicated reliability test"""
+    print("\nreliability test (re-query working servers alongside the 3 fastest):")
+    print("  enter y to run it after the main test, or press enter to skip")
+    choice = input("run reliability test? (y/N): ").strip().lower()
+    return choice in ('y', 'yes')
+
 def get_test_domain():
     """get valid test domain from user with numbered menu"""
     domains = ["google.com", "cloudflare.com", "example.com"]
@@ -178,60 +272,271 @@ def get_test_domain():
         
         print("invalid! use 1-3 or valid domain")
 
-def test_single_server(server, domain, timeout=3, include_firewall=False):
-    """test single dns server with response time"""
+def skip_name(data, offset):
+    """return offset just past a (possibly compressed) dns name"""
+    while True:
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            return offset + 2
+        if length == 0:
+            return offset + 1
+        offset += length + 1
+
+def build_query(domain):
+    """build wire-format A query for domain once, transaction id left as zero"""
+    header = struct.pack('!6H', 0, 0x0100, 1, 0, 0, 0)
+    return header + dns.name.from_text(domain).to_wire() + struct.pack('!HH', 1, 1)
+
+def parse_a_records(data):
+    """extract raw 4-byte A record addresses from a raw dns response"""
     try:
-        socket.inet_aton(server)
-    except socket.error:
-        return False, (server, None), f"{server} invalid ip"
+        _, flags, qdcount, ancount, _, _ = struct.unpack_from('!6H', data)
+        if not flags & 0x8000:
+            raise dns.exception.FormError
+        rcode = flags & 0x000F
+        if rcode == 3:
+            raise dns.resolver.NXDOMAIN
+        if rcode != 0:
+            raise dns.exception.DNSException(f"rcode {rcode}")
+        
+        offset = 12
+        for _ in range(qdcount):
+            offset = skip_name(data, offset) + 4
+        
+        ips = []
+        for _ in range(ancount):
+            offset = skip_name(data, offset)
+            rtype, rclass, _, rdlength = struct.unpack_from('!HHIH', data, offset)
+            offset += 10
+            if rtype == 1 and rclass == 1 and rdlength == 4:
+                ips.append(data[offset:offset + 4])
+            offset += rdlength
+    except (struct.error, IndexError):
+        raise dns.exception.FormError
     
-    start_time = time.time()
-    resolver = dns.resolver.Resolver(configure=False)
-    resolver.nameservers = [server]
-    resolver.timeout = timeout
-    resolver.lifetime = timeout
+    if not ips:
+        raise dns.resolver.NoAnswer
+    return ips
+
+def make_udp_socket():
+    """pre-bound udp socket shared by every test, sized for reply bursts"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # up to 500 replies can land at once, the default buffer drops some
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    except OSError:
+        pass
+    sock.bind(('0.0.0.0', 0))
+    sock.setblocking(False)
+    return sock
+
+class DNSClient(asyncio.DatagramProtocol):
+    """one udp socket shared by all tests, replies matched by transaction id"""
+    
+    def __init__(self, domain):
+        self.domain = domain
+        self.query = bytearray(build_query(domain))
+        self.pending = {}
+        self.transport = None
+        self.loop = None
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.loop = asyncio.get_running_loop()
+    
+    def datagram_received(self, data, addr):
+        if len(data) < 12:
+            return
+        txid = struct.unpack_from('!H', data)[0]
+        entry = self.pending.get(txid)
+        if entry and entry[0] == addr[0] and not entry[1].done():
+            entry[1].set_result(data)
+    
+    def error_received(self, exc):
+        # icmp errors can't be tied to a query, those tests just time out
+        # (main uses the selector loop on windows, which keeps reading after)
+        pass
+    
+    def expire(self, future, timeout):
+        if not future.done():
+            future.set_exception(dns.exception.Timeout(timeout=timeout))
+    
+    async def resolve(self, server, timeout):
+        """send the query to server and wait for its raw reply"""
+        txid = random.getrandbits(16)
+        while txid in self.pending:
+            txid = random.getrandbits(16)
+        
+        future = self.loop.create_future()
+        self.pending[txid] = (server, future)
+        timer = self.loop.call_later(timeout, self.expire, future, timeout)
+        try:
+            struct.pack_into('!H', self.query, 0, txid)
+            # send a snapshot, uvloop may hold on to the buffer until it's sent
+            self.transport.sendto(bytes(self.query), (server, 53))
+            return await future
+        finally:
+            timer.cancel()
+            del self.pending[txid]
+
+async def query_server(client, server, timeout, cache_ttl=0):
+    """A records and response time in ms, reused for cache_ttl seconds if set"""
+    key = (server, client.domain)
+    if cache_ttl:
+        cached = response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < cache_ttl:
+            _, error_type, error_args, result = cached
+            if error_type is not None:
+                raise error_type(*error_args)
+            return result
+    
+    start_time = time.perf_counter_ns()
+    try:
+        returned_ips = parse_a_records(await client.resolve(server, timeout))
+    except dns.exception.DNSException as e:
+        # timeouts aren't cached, a retest may be run with a longer timeout
+        if cache_ttl and not isinstance(e, dns.exception.Timeout):
+            response_cache[key] = (time.monotonic(), type(e), e.args, None)
+        raise
+    
+    result = (returned_ips, (time.perf_counter_ns() - start_time) / 1e6)
+    if cache_ttl:
+        response_cache[key] = (time.monotonic(), None, None, result)
+    return result
+
+async def test_single_server(client, server, timeout=3, cache_ttl=0):
+    """test single dns server, returns (status, server, response_time, first_ip, first_fw)"""
+    start_time = time.perf_counter_ns()
     
     try:
-        answers = resolver.resolve(domain, 'A')
-        response_time = (time.time() - start_time) * 1000
+        returned_ips, response_time = await query_server(client, server, timeout, cache_ttl)
         
-        firewall_ips = {'10.10.34.34', '10.10.34.35', '10.10.34.36'}
-        returned_ips = [str(answer) for answer in answers]
-        firewall_found = any(ip in firewall_ips for ip in returned_ips)
+        firewall_hits = FIREWALL_IPS.intersection(returned_ips)
+        if firewall_hits:
+            return FIREWALL, server, response_time, returned_ips[0], next(iter(firewall_hits))
+        return OK, server, response_time, returned_ips[0], None
         
-        first_ip = str(answers[0])
+    except dns.exception.DNSException as e:
+        status = next((ERROR_CODES[t] for t in type(e).__mro__ if t in ERROR_CODES), DNS_ERROR)
+    except Exception:
+        status = ERROR
+    
+    return status, server, (time.perf_counter_ns() - start_time) / 1e6, None, None
+
+def format_result(result, include_firewall):
+    """human-readable progress line for one test result"""
+    status, server, response_time, first_ip, first_fw = result
+    if status == OK:
+        return f"{server} ok {response_time:.0f}ms ({socket.inet_ntoa(first_ip)})"
+    if status == FIREWALL:
+        if include_firewall:
+            return f"{server} firewall blocked {response_time:.0f}ms ({socket.inet_ntoa(first_fw)})"
+        return f"{server} firewall blocked ({socket.inet_ntoa(first_fw)})"
+    if status == CRASH:
+        return f"crash {server}"
+    return f"{server} {STATUS_TEXT[status]}"
+
+def format_server_info(result):
+    """working_dns.txt line for a working server"""
+    status, server, response_time, _, first_fw = result
+    if status == FIREWALL:
+        return f"{server} (firewall:{socket.inet_ntoa(first_fw)}) ({response_time:.0f}ms)"
+    return f"{server} ({response_time:.0f}ms)"
+
+async def timed_query(client, server, timeout, limit):
+    """response time in ms for one answered query, None if it failed"""
+    async with limit:
+        start_time = time.perf_counter_ns()
+        try:
+            parse_a_records(await client.resolve(server, timeout))
+        except Exception:
+            return None
+        return (time.perf_counter_ns() - start_time) / 1e6
+
+async def replicated_test(client, server, canaries, timeout, limit):
+    """query server alongside two canaries and keep the first answer"""
+    group = [server] + [ip for ip in canaries if ip != server][:2]
+    times = await asyncio.gather(*(timed_query(client, ip, timeout, limit) for ip in group))
+    times = [t for t in times if t is not None]
+    return server, (min(times) if times else None)
+
+def percentile(values, pct):
+    """nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+async def run_tests(servers, domain, workers, timeout, include_firewall,
+                    reliability=False, verbose=False, cache_ttl=0, save_queue=None):
+    """test all servers from one event loop, at most `workers` in flight"""
+    if save_queue is None:
+        save_queue = queue.Queue()
+    loop = asyncio.get_running_loop()
+    transport, client = await loop.create_datagram_endpoint(
+        lambda: DNSClient(domain), sock=make_udp_socket()
+    )
+    limit = asyncio.Semaphore(workers)
+    working = []
+    failed = []
+    replicated = []
+    
+    async def limited_test(server):
+        async with limit:
+            try:
+                return await test_single_server(client, server, timeout, cache_ttl)
+            except Exception:
+                return CRASH, server, None, None, None
+    
+    try:
+        fastest = []
+        with tqdm(total=len(servers), desc="Progress", unit="server", ascii=' █') as pbar:
+            tests = [limited_test(server) for server in servers]
+            for done, next_result in enumerate(asyncio.as_completed(tests), 1):
+                result = await next_result
+                status, server_ip, response_time = result[:3]
+                
+                if status == OK or (status == FIREWALL and include_firewall):
+                    working.append((server_ip, response_time))
+                    real_time_save(save_queue, format_server_info(result))
+                    # running top 10 as a max-heap of negated times
+                    new_fastest = True
+                    if len(fastest) < 10:
+                        heapq.heappush(fastest, -response_time)
+                    elif response_time < -fastest[0]:
+                        heapq.heapreplace(fastest, -response_time)
+                    else:
+                        new_fastest = False
+                    if new_fastest or verbose:
+                        tqdm.write(f"✅ {format_result(result, include_firewall)}")
+                else:
+                    failed.append(server_ip)
+                    if verbose:
+                        tqdm.write(f"❌ {format_result(result, include_firewall)}")
+                
+                if done % PROGRESS_EVERY == 0 or done == len(servers):
+                    pbar.set_postfix(ok=len(working), fail=len(failed), refresh=False)
+                    pbar.update(done - pbar.n)
         
-        if firewall_found:
-            first_fw = next(ip for ip in returned_ips if ip in firewall_ips)
+        if reliability and working:
+            canaries = [ip for ip, _ in heapq.nsmallest(3, working, key=lambda x: x[1])]
+            solo = dict(working)
+            print(f"\nreliability test - canaries: {', '.join(canaries)}")
+            real_time_save(save_queue, f"# reliability test - canaries: {', '.join(canaries)}")
+            real_time_save(save_queue, "# format: ip (solo_ms) (replicated_ms)")
             
-            if include_firewall:
-                server_info = f"{server} (firewall:{first_fw}) ({response_time:.0f}ms)"
-                real_time_save(server_info)
-                return True, (server, response_time), f"{server} firewall blocked {response_time:.0f}ms ({first_fw})"
-            else:
-                return False, (server, response_time), f"{server} firewall blocked ({first_fw})"
-        
-        server_info = f"{server} ({first_fw}) ({response_time:.0f}ms)"
-        real_time_save(server_info)
-        return True, (server, response_time), f"{server} ok {response_time:.0f}ms ({first_ip})"
-        
-    except dns.resolver.NXDOMAIN:
-        response_time = (time.time() - start_time) * 1000
-        return False, (server, response_time), f"{server} nxdomain"
-    except dns.resolver.Timeout:
-        response_time = (time.time() - start_time) * 1000
-        return False, (server, response_time), f"{server} timeout"
-    except dns.resolver.NoAnswer:
-        response_time = (time.time() - start_time) * 1000
-        return False, (server, response_time), f"{server} no answer"
-    except dns.exception.DNSException as e:
-        response_time = (time.time() - start_time) * 1000
-        return False, (server, response_time), f"{server} dns error"
-    except Exception as e:
-        response_time = (time.time() - start_time) * 1000
-        return False, (server, response_time), f"{server} error"
+            with tqdm(total=len(solo), desc="Reliability", unit="server", ascii=' █') as pbar:
+                tests = [replicated_test(client, server, canaries, timeout, limit) for server in solo]
+                for next_result in asyncio.as_completed(tests):
+                    server, replicated_time = await next_result
+                    if replicated_time is not None:
+                        replicated.append((server, replicated_time))
+                        real_time_save(save_queue, f"{server} ({solo[server]:.0f}ms) ({replicated_time:.0f}ms)")
+                    pbar.update(1)
+    finally:
+        transport.close()
+    
+    return working, failed, replicated
 
-def check_dns_servers(filename='dns_servers.txt'):
+def check_dns_servers(filename='dns_servers.txt', verbose=False, cache_ttl=0):
     """main testing function"""
     print("Azadi DNS Tester")
     print("=" * 50)
@@ -245,8 +550,10 @@ def check_dns_servers(filename='dns_servers.txt'):
     timeout = get_timeout()
     domain = get_test_domain()
     include_firewall = get_filter_option()
+    reliability = get_reliability_option()
     
-    write_header(domain, include_firewall)
+    fd = open_working_file()
+    write_header(fd, domain, include_firewall)
     
     print(f"\nstarting test of {len(servers)} dns servers")
     print(f"workers={workers} | timeout={timeout}s | domain={domain}")
@@ -254,33 +561,20 @@ def check_dns_servers(filename='dns_servers.txt'):
     print("-" * 50)
     
     start_time = time.time()
-    working = []
-    failed = []
-    
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_server = {
-            executor.submit(test_single_server, server, domain, timeout, include_firewall): server 
-            for server in servers
-        }
-        
-        with tqdm(total=len(servers), desc="Progress", unit="server", ascii=' █') as pbar:
-            for future in as_completed(future_to_server):
-                try:
-                    success, result, message = future.result()
-                    server_ip, response_time = result
-                    
-                    if success:
-                        working.append(result)
-                        tqdm.write(f"✅ {message}")
-                    else:
-                        failed.append(server_ip)
-                        tqdm.write(f"❌ {message}")
-                except Exception as e:
-                    server = future_to_server[future]
-                    failed.append(server)
-                    tqdm.write(f"❌ crash {server}")
-                
-                pbar.update(1)
+    # fresh queue per run, so lines a failed writer left behind can't leak
+    # into the next run's file
+    save_queue = queue.Queue()
+    writer = threading.Thread(target=save_writer, args=(fd, save_queue), daemon=True)
+    writer.start()
+    try:
+        working, failed, replicated = asyncio.run(
+            run_tests(servers, domain, workers, timeout, include_firewall,
+                      reliability, verbose, cache_ttl, save_queue)
+        )
+    finally:
+        save_queue.put(None)
+        writer.join()
+        os.close(fd)
     
     print("\n" + "="*50)
     print("RESULTS")
@@ -296,19 +590,49 @@ def check_dns_servers(filename='dns_servers.txt'):
     
     if working:
         print("\ntop 5 fastest:")
-        sorted_working = sorted(working, key=lambda x: x[1])
-        for i, (ip, ms) in enumerate(sorted_working[:5], 1):
+        top5 = heapq.nsmallest(5, working, key=lambda x: x[1])
+        for i, (ip, ms) in enumerate(top5, 1):
             print(f"  {i}. {ip:<15} {ms:.0f}ms")
     
+    if replicated:
+        print("\nreliability test (95th percentile):")
+        print(f"  solo:       {percentile([ms for _, ms in working], 95):.0f}ms")
+        print(f"  replicated: {percentile([ms for _, ms in replicated], 95):.0f}ms")
+    
     print(f"\nresults saved: working_dns.txt ({len(working)} servers)")
     return working
 
+def parse_args():
+    """parse command line options"""
+    parser = argparse.ArgumentParser(description="Azadi DNS Tester")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="print every tested server, not only new fastest ones")
+    parser.add_argument('--cache-ttl', type=int, default=0, metavar='SECONDS',
+                        help="reuse each server's answer for this long when testing again "
+                             "in the same session (default: 0, off)")
+    return parser.parse_args()
+
 def main():
     """main entry point"""
+    args = parse_args()
+    if sys.platform == 'win32':
+        # the proactor loop stops reading a udp socket after one icmp
+        # port unreachable (WSAECONNRESET), the selector loop keeps going
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            # optional: libuv event loop, not available on windows
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     try:
-        check_dns_servers()
-        print("\nTesting complete!")
-        input("Press enter to exit...")
+        while True:
+            check_dns_servers(verbose=args.verbose, cache_ttl=args.cache_ttl)
+            print("\nTesting complete!")
+            if input("Press enter to exit, or r to test again: ").strip().lower() != 'r':
+                break
     except KeyboardInterrupt:
         print("\nInterrupted by user")
     except Exception as e: